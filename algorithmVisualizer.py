@@ -1,7 +1,15 @@
 import pygame
+import numpy as np
 import random
 import math
-from queue import PriorityQueue, Queue
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the search cores then run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # Initialize Pygame
 pygame.init()
@@ -10,6 +18,11 @@ pygame.init()
 WIDTH, HEIGHT = 800, 800
 ROWS, COLS = 30, 30
 CELL_SIZE = WIDTH // COLS
+ANIMATION_BATCH = 20  # Visited cells revealed per frame
+PATH_BATCH = 2  # Path cells revealed per frame
+
+# A* heuristic: "manhattan" is admissible for 4-connected moves, switch to "octile" if diagonals are added
+HEURISTIC_MODE = "manhattan"
 
 # Colors
 WHITE = (255, 255, 255)
@@ -28,72 +41,363 @@ clock = pygame.time.Clock()
 # Node States
 START, END, WALL, PATH, PROCESSING = 1, 2, 3, 4, 5
 
-class Node:
-    def __init__(self, row, col):
-        self.row = row
-        self.col = col
-        self.state = 0  # 0: empty, 1: start, 2: end, 3: wall, 4: path, 5: processing
-        self.distance = float("inf")
-        self.heuristic = 0
-        self.prev = None
-
-    def __lt__(self, other):
-        return self.distance < other.distance  # Compare based on distance
-
-    def draw(self):
-        color = self.get_color()
-        pygame.draw.rect(screen, color, (self.col * CELL_SIZE, self.row * CELL_SIZE, CELL_SIZE - 1, CELL_SIZE - 1))
-
-    def get_color(self):
-        if self.state == START:
-            return GREEN
-        elif self.state == END:
-            return RED
-        elif self.state == WALL:
-            return BLACK
-        elif self.state == PATH:
-            return YELLOW
-        elif self.state == PROCESSING:
-            return GRAY
-        return WHITE
-
-    def reset(self):
-        self.state = 0  # Reset to empty
-        self.prev = None
-        self.distance = float("inf")
-        self.heuristic = 0
+# Cell colors indexed by state
+CELL_COLORS = (WHITE, GREEN, RED, BLACK, YELLOW, GRAY)
+COLOR_LUT = np.array(CELL_COLORS, np.uint8)
+LINES_COLORKEY = (255, 0, 255)  # Transparent in the grid line overlay
 
 class Grid:
     def __init__(self):
-        self.grid = [[Node(row, col) for col in range(COLS)] for row in range(ROWS)]
+        # Cells are addressed by the packed index row * COLS + col
+        self.state = np.zeros((ROWS, COLS), np.uint8)  # 0: empty, 1: start, 2: end, 3: wall, 4: path, 5: processing
+        self.distance = np.full((ROWS, COLS), np.inf, np.float32)
+        self.prev = np.full((ROWS, COLS), -1, np.int32)
+        self.heuristic = np.zeros((ROWS, COLS), np.float32)
         self.start = None
         self.end = None
-
-    def draw(self):
-        for row in self.grid:
-            for node in row:
-                node.draw()
+        self.dirty = set()  # Cells changed since the last draw
+        # Inset by the grid line on the top/left and the gap on the bottom/right
+        self.rects = [pygame.Rect(col * CELL_SIZE + 1, row * CELL_SIZE + 1, CELL_SIZE - 2, CELL_SIZE - 2)
+                      for row in range(ROWS) for col in range(COLS)]
+
+        # A full redraw paints one pixel per cell, scales it up to the board and
+        # lays the grid lines over it; the lines never change, so render them once
+        self.cells = pygame.Surface((COLS, ROWS)).convert()
+        self.board = pygame.Surface((COLS * CELL_SIZE, ROWS * CELL_SIZE)).convert()
+        self.lines = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self.lines.fill(WHITE)
+        self.lines.fill(LINES_COLORKEY, self.board.get_rect())
+        for x in range(CELL_SIZE - 1, WIDTH, CELL_SIZE):
+            pygame.draw.line(self.lines, WHITE, (x, 0), (x, HEIGHT))
+        for y in range(CELL_SIZE - 1, HEIGHT, CELL_SIZE):
+            pygame.draw.line(self.lines, WHITE, (0, y), (WIDTH, y))
         for x in range(0, WIDTH, CELL_SIZE):
-            pygame.draw.line(screen, GRAY, (x, 0), (x, HEIGHT))
+            pygame.draw.line(self.lines, GRAY, (x, 0), (x, HEIGHT))
         for y in range(0, HEIGHT, CELL_SIZE):
-            pygame.draw.line(screen, GRAY, (0, y), (WIDTH, y))
-
-    def get_neighbors(self, node):
-        neighbors = []
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # Right, Down, Left, Up
-        for dr, dc in directions:
-            r, c = node.row + dr, node.col + dc
-            if 0 <= r < ROWS and 0 <= c < COLS and self.grid[r][c].state != WALL:
-                neighbors.append(self.grid[r][c])
-        return neighbors
+            pygame.draw.line(self.lines, GRAY, (0, y), (WIDTH, y))
+        self.lines.set_colorkey(LINES_COLORKEY)
+
+    def set_state(self, cells, state):
+        # cells is a packed index or an array of them
+        self.state.flat[cells] = state
+        self.dirty.update(np.atleast_1d(cells).tolist())
+
+    def draw(self, full=False):
+        # Returns the changed rects for pygame.display.update
+        if full:
+            pygame.surfarray.blit_array(self.cells, COLOR_LUT[self.state].swapaxes(0, 1))
+            pygame.transform.scale(self.cells, self.board.get_size(), self.board)
+            screen.blit(self.board, (0, 0))
+            screen.blit(self.lines, (0, 0))
+            self.dirty.clear()
+            return [screen.get_rect()]
+
+        state = self.state.ravel()
+        rects = []
+        for idx in self.dirty:
+            rect = self.rects[idx]
+            screen.fill(CELL_COLORS[state[idx]], rect)
+            rects.append(rect)
+        self.dirty.clear()
+        return rects
+
+    def clear(self):
+        # Drop search results but keep start, end and walls
+        self.state[self.state >= PATH] = 0
+        self.distance.fill(np.inf)
+        self.prev.fill(-1)
+        self.heuristic.fill(0)
+        self.dirty.clear()
 
     def reset(self):
-        for row in self.grid:
-            for node in row:
-                node.reset()  # Reset each node
+        self.clear()
+        self.state.fill(0)
         self.start = None
         self.end = None
 
+# Neighbor steps: Right, Down, Left, Up. A tuple constant, so neighbor
+# expansion in the cores allocates nothing and loads no arrays
+_NEIGHBOR_STEPS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# Array-backed binary min-heap ordered by (key, tie); tie is a push counter so
+# equal keys pop in insertion order. Sifting moves a hole instead of swapping
+@njit(cache=True)
+def _heap_push(keys, ties, items, size, key, tie, item):
+    i = size
+    while i > 0:
+        parent = (i - 1) // 2
+        if keys[parent] < key or (keys[parent] == key and ties[parent] < tie):
+            break
+        keys[i], ties[i], items[i] = keys[parent], ties[parent], items[parent]
+        i = parent
+    keys[i], ties[i], items[i] = key, tie, item
+    return size + 1
+
+@njit(cache=True)
+def _heap_pop(keys, ties, items, size):
+    key, item = keys[0], items[0]
+    size -= 1
+    last_key, last_tie, last_item = keys[size], ties[size], items[size]
+    i = 0
+    while 2 * i + 1 < size:
+        child = 2 * i + 1
+        if child + 1 < size and (keys[child + 1] < keys[child] or
+                                 (keys[child + 1] == keys[child] and ties[child + 1] < ties[child])):
+            child += 1
+        if last_key < keys[child] or (last_key == keys[child] and last_tie < ties[child]):
+            break
+        keys[i], ties[i], items[i] = keys[child], ties[child], items[child]
+        i = child
+    keys[i], ties[i], items[i] = last_key, last_tie, last_item
+    return key, item, size
+
+# Search cores work on the flattened Grid arrays and return the expansion order,
+# leaving the drawing to PathfindingVisualizer. They are built per grid size so
+# rows and cols are compile-time constants: bounds checks and row * cols + c
+# indexing are folded by the compiler instead of read from arguments
+def make_searchers(rows, cols):
+    @njit(cache=True)
+    def dijkstra_core(state, distance, prev, start_idx, end_idx):
+        visited_order = np.empty(rows * cols, np.int32)
+        visited_count = 0
+        # Each cell is expanded once and relaxes at most 4 neighbors
+        keys = np.empty(4 * rows * cols + 1, np.float32)
+        ties = np.empty(4 * rows * cols + 1, np.int32)
+        items = np.empty(4 * rows * cols + 1, np.int32)
+        distance[start_idx] = 0
+        size = _heap_push(keys, ties, items, 0, 0.0, 0, start_idx)
+        pushes = 1
+
+        while size > 0:
+            dist, current, size = _heap_pop(keys, ties, items, size)
+            if dist > distance[current]:
+                continue  # Stale entry
+            if current == end_idx:
+                break
+
+            visited_order[visited_count] = current
+            visited_count += 1
+
+            row, col = current // cols, current % cols
+            for dr, dc in _NEIGHBOR_STEPS:
+                r, c = row + dr, col + dc
+                if 0 <= r < rows and 0 <= c < cols:
+                    neighbor = r * cols + c
+                    temp_distance = distance[current] + 1
+                    if state[neighbor] != WALL and temp_distance < distance[neighbor]:
+                        distance[neighbor] = temp_distance
+                        prev[neighbor] = current
+                        size = _heap_push(keys, ties, items, size, temp_distance, pushes, neighbor)
+                        pushes += 1
+
+        return visited_order[:visited_count], prev
+
+    @njit(cache=True)
+    def a_star_core(state, distance, heuristic, prev, start_idx, end_idx):
+        visited_order = np.empty(rows * cols, np.int32)
+        visited_count = 0
+        # Each cell is expanded once and relaxes at most 4 neighbors
+        keys = np.empty(4 * rows * cols + 1, np.float32)
+        ties = np.empty(4 * rows * cols + 1, np.int32)
+        items = np.empty(4 * rows * cols + 1, np.int32)
+        closed = np.zeros(rows * cols, np.uint8)
+        distance[start_idx] = 0
+        size = _heap_push(keys, ties, items, 0, heuristic[start_idx], 0, start_idx)
+        pushes = 1
+
+        while size > 0:
+            _, current, size = _heap_pop(keys, ties, items, size)
+            if closed[current]:
+                continue  # Stale entry; with a consistent heuristic the first pop is final
+            closed[current] = 1
+            if current == end_idx:
+                break
+
+            visited_order[visited_count] = current
+            visited_count += 1
+
+            row, col = current // cols, current % cols
+            for dr, dc in _NEIGHBOR_STEPS:
+                r, c = row + dr, col + dc
+                if 0 <= r < rows and 0 <= c < cols:
+                    neighbor = r * cols + c
+                    temp_distance = distance[current] + 1
+                    if state[neighbor] != WALL and temp_distance < distance[neighbor]:
+                        distance[neighbor] = temp_distance
+                        prev[neighbor] = current
+                        # Equal f ties go to the newest entry, so the search runs deep along the goal direction
+                        size = _heap_push(keys, ties, items, size, temp_distance + heuristic[neighbor], -pushes, neighbor)
+                        pushes += 1
+
+        return visited_order[:visited_count], prev
+
+    @njit(cache=True)
+    def bfs_core(state, prev, start_idx, end_idx):
+        visited_order = np.empty(rows * cols, np.int32)
+        visited_count = 0
+        queue = np.empty(rows * cols, np.int32)  # Every cell is enqueued at most once
+        head, tail = 0, 1
+        queue[0] = start_idx
+        visited = np.zeros(rows * cols, np.uint8)
+        visited[start_idx] = 1
+
+        while head < tail:
+            current = queue[head]
+            head += 1
+            if current == end_idx:
+                break
+
+            visited_order[visited_count] = current
+            visited_count += 1
+
+            row, col = current // cols, current % cols
+            for dr, dc in _NEIGHBOR_STEPS:
+                r, c = row + dr, col + dc
+                if 0 <= r < rows and 0 <= c < cols:
+                    neighbor = r * cols + c
+                    if state[neighbor] != WALL and not visited[neighbor]:
+                        visited[neighbor] = 1
+                        prev[neighbor] = current
+                        queue[tail] = neighbor
+                        tail += 1
+
+        return visited_order[:visited_count], prev
+
+    @njit(cache=True)
+    def dfs_core(state, prev, start_idx, end_idx):
+        visited_order = np.empty(rows * cols, np.int32)
+        visited_count = 0
+        stack = np.empty(4 * rows * cols, np.int32)  # Each expansion pushes at most 4 cells
+        top = 1
+        stack[0] = start_idx
+        visited = np.zeros(rows * cols, np.uint8)
+
+        while top > 0:
+            top -= 1
+            current = stack[top]
+            if current == end_idx:
+                break
+
+            if not visited[current]:
+                visited[current] = 1
+                visited_order[visited_count] = current
+                visited_count += 1
+
+                row, col = current // cols, current % cols
+                for dr, dc in _NEIGHBOR_STEPS:
+                    r, c = row + dr, col + dc
+                    if 0 <= r < rows and 0 <= c < cols:
+                        neighbor = r * cols + c
+                        if state[neighbor] != WALL and not visited[neighbor]:
+                            prev[neighbor] = current
+                            stack[top] = neighbor
+                            top += 1
+
+        return visited_order[:visited_count], prev
+
+    @njit(cache=True)
+    def bidirectional_dijkstra_core(state, distance, prev, start_idx, end_idx):
+        visited_order = np.empty(rows * cols, np.int32)
+        visited_count = 0
+        # Index 0 searches forward from the start, index 1 backward from the end
+        dist = np.full((2, rows * cols), np.inf, np.float32)
+        parent = np.full((2, rows * cols), -1, np.int32)
+        visited = np.zeros((2, rows * cols), np.uint8)
+        keys = np.empty((2, 4 * rows * cols + 1), np.float32)
+        ties = np.empty((2, 4 * rows * cols + 1), np.int32)
+        items = np.empty((2, 4 * rows * cols + 1), np.int32)
+        sizes = np.zeros(2, np.int64)
+        dist[0, start_idx] = 0
+        dist[1, end_idx] = 0
+        sizes[0] = _heap_push(keys[0], ties[0], items[0], 0, 0.0, 0, start_idx)
+        sizes[1] = _heap_push(keys[1], ties[1], items[1], 0, 0.0, 0, end_idx)
+        pushes = 1
+        best = np.inf
+        meet_fwd, meet_bwd = -1, -1  # Adjacent cells joining the two half paths
+
+        while sizes[0] > 0 and sizes[1] > 0:
+            if keys[0, 0] + keys[1, 0] >= best:
+                break
+            side = 0 if keys[0, 0] <= keys[1, 0] else 1
+            other = 1 - side
+            d, current, sizes[side] = _heap_pop(keys[side], ties[side], items[side], sizes[side])
+            if d > dist[side, current] or visited[side, current]:
+                continue  # Stale entry
+            visited[side, current] = 1
+            if not visited[other, current]:
+                visited_order[visited_count] = current
+                visited_count += 1
+
+            row, col = current // cols, current % cols
+            for dr, dc in _NEIGHBOR_STEPS:
+                r, c = row + dr, col + dc
+                if 0 <= r < rows and 0 <= c < cols:
+                    neighbor = r * cols + c
+                    if state[neighbor] == WALL:
+                        continue
+                    temp_distance = dist[side, current] + 1
+                    if temp_distance < dist[side, neighbor]:
+                        dist[side, neighbor] = temp_distance
+                        parent[side, neighbor] = current
+                        sizes[side] = _heap_push(keys[side], ties[side], items[side], sizes[side],
+                                                 temp_distance, pushes, neighbor)
+                        pushes += 1
+                    if temp_distance + dist[other, neighbor] < best:
+                        best = temp_distance + dist[other, neighbor]
+                        if side == 0:
+                            meet_fwd, meet_bwd = current, neighbor
+                        else:
+                            meet_fwd, meet_bwd = neighbor, current
+
+        distance[:] = dist[0]
+        prev[:] = parent[0]
+        if meet_fwd != -1:
+            # Stitch the backward half onto prev so the path can be walked back from the end
+            prev[meet_bwd] = meet_fwd
+            current = meet_bwd
+            while current != end_idx:
+                prev[parent[1, current]] = current
+                current = parent[1, current]
+
+        return visited_order[:visited_count], prev
+
+    return dijkstra_core, a_star_core, bfs_core, dfs_core, bidirectional_dijkstra_core
+
+_dijkstra_core, _a_star_core, _bfs_core, _dfs_core, _bidirectional_dijkstra_core = make_searchers(ROWS, COLS)
+
+@njit(cache=True)
+def _extract_path(prev, idx):
+    path = np.empty(len(prev), np.int32)
+    length = 0
+    while idx != -1:
+        path[length] = idx
+        length += 1
+        idx = prev[idx]
+    return path[length - 1::-1]
+
+def _warm_up_cores():
+    # The cores compile on first call; run each once on a throwaway grid with the
+    # end next to the start so the first real search doesn't stall the UI
+    state = np.zeros(ROWS * COLS, np.uint8)
+    distance = np.full(ROWS * COLS, np.inf, np.float32)
+    heuristic = np.zeros(ROWS * COLS, np.float32)
+    prev = np.full(ROWS * COLS, -1, np.int32)
+    _dijkstra_core(state, distance, prev, 0, 1)
+    _a_star_core(state, distance, heuristic, prev, 0, 1)
+    _bfs_core(state, prev, 0, 1)
+    _dfs_core(state, prev, 0, 1)
+    _bidirectional_dijkstra_core(state, distance, prev, 0, 1)
+    _extract_path(prev, 1)
+
+# Heuristics take the absolute row/column offsets to the end
+def _h_manhattan(dr, dc):
+    return dr + dc
+
+def _h_octile(dr, dc):
+    return (dr + dc) + (math.sqrt(2) - 2) * np.minimum(dr, dc)
+
+HEURISTICS = {"manhattan": _h_manhattan, "octile": _h_octile}
+
 class PathfindingVisualizer:
     def __init__(self):
         self.grid = Grid()
@@ -102,6 +406,17 @@ class PathfindingVisualizer:
         self.visited_count = 0
         self.path_length = 0
         self.show_ui = True  # Flag to control UI visibility
+        self._heuristic_cache = {}  # (end index, HEURISTIC_MODE) -> heuristic field
+        self._popup_font = pygame.font.SysFont("Arial", 30)
+        # Semi-transparent overlay; needs SRCALPHA or the alpha byte is ignored
+        self._popup_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._popup_overlay.fill((255, 255, 255, 180))  # White with some transparency
+
+        # Compiling the cores can take seconds on a cold cache, so say so instead of freezing
+        screen.fill(WHITE)
+        screen.blit(self._popup_font.render("Compiling search algorithms...", True, BLACK), (20, 20))
+        pygame.display.update()
+        _warm_up_cores()
 
     def run(self):
         while self.running:
@@ -122,50 +437,64 @@ class PathfindingVisualizer:
     def handle_mouse_click(self):
         x, y = pygame.mouse.get_pos()
         col, row = x // CELL_SIZE, y // CELL_SIZE
-        node = self.grid.grid[row][col]
-
-        if node.state == 0:  # Only place if the node is empty
-            if not self.grid.start:  # Place start if not already placed
-                node.state = START
-                self.grid.start = node
-            elif not self.grid.end:  # Place end if not already placed
-                node.state = END
-                self.grid.end = node
+        idx = row * COLS + col
+
+        if self.grid.state[row, col] == 0:  # Only place if the node is empty
+            if self.grid.start is None:  # Place start if not already placed
+                self.grid.set_state(idx, START)
+                self.grid.start = idx
+            elif self.grid.end is None:  # Place end if not already placed
+                self.grid.set_state(idx, END)
+                self.grid.end = idx
             else:  # If both are placed, place walls
-                node.state = WALL
+                self.grid.set_state(idx, WALL)
 
     def handle_key_press(self, event):
-        if event.key == pygame.K_d and self.grid.start and self.grid.end:
+        ready = self.grid.start is not None and self.grid.end is not None
+        if event.key == pygame.K_d and ready:
             self.run_algorithm(self.dijkstra)
-        elif event.key == pygame.K_a and self.grid.start and self.grid.end:
+        elif event.key == pygame.K_a and ready:
             self.run_algorithm(self.a_star)
-        elif event.key == pygame.K_b and self.grid.start and self.grid.end:
+        elif event.key == pygame.K_b and ready:
             self.run_algorithm(self.bfs)
-        elif event.key == pygame.K_f and self.grid.start and self.grid.end:
+        elif event.key == pygame.K_f and ready:
             self.run_algorithm(self.dfs)
+        elif event.key == pygame.K_2 and ready:
+            self.run_algorithm(self.bidirectional_dijkstra)
         elif event.key == pygame.K_c:
-            self.grid.reset()  # Clear the grid without resetting start and end
+            self.grid.clear()  # Clear the grid without resetting start and end
         elif event.key == pygame.K_r:  # Reset build
             self.grid.reset()  # Reset all nodes and clear everything
+            self._heuristic_cache.clear()
 
     def run_algorithm(self, algorithm):
         self.show_ui = False  # Hide UI during algorithm execution
-        self.visited_count = algorithm()
+        self.grid.clear()  # Searches expect fresh distance/prev arrays
+        visited_order, prev = algorithm()  # Search runs to completion before anything is drawn
+
+        state = self.grid.state.ravel()
+        # Keep the start and end colors; the backward search expands the end too
+        processed = visited_order[(state[visited_order] != START) & (state[visited_order] != END)]
+        self.grid.draw(full=True)  # Clear the info panel off the grid
+        pygame.display.update()
+        self._animate(processed, PROCESSING, ANIMATION_BATCH)
+
+        if prev[self.grid.end] == -1:
+            self.visited_count = 0  # No path found
+        else:
+            self.visited_count = len(visited_order)
+            path = self.reconstruct_path(self.grid.end)
+            self.path_length = len(path) - 1  # Number of moves from start to end
+            self._animate(path[1:-1], PATH, PATH_BATCH)  # Keep the start and end colors
         self.show_ui = True  # Show UI again after execution
         self.show_popup(f"Visited Nodes: {self.visited_count}\nPath Length: {self.path_length}")
 
     def show_popup(self, message):
-        font = pygame.font.SysFont("Arial", 30)
-        text_surface = font.render(message, True, BLACK)
+        text_surface = self._popup_font.render(message, True, BLACK)
         text_rect = text_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-        
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT))
-        overlay.fill((255, 255, 255, 180))  # White with some transparency
-        screen.blit(overlay, (0, 0))
-        
-        # Draw the text
-        screen.blit(text_surface, text_rect)
+
+        # Draw the overlay and the text in one batch
+        screen.blits([(self._popup_overlay, (0, 0)), (text_surface, text_rect)], doreturn=False)
         pygame.display.update()
 
         # Wait for a key press to close the popup
@@ -178,138 +507,53 @@ class PathfindingVisualizer:
                     waiting = False
 
     def update_display(self):
-        screen.fill(WHITE)
-        self.grid.draw()  # Draw the grid first
+        self.grid.draw(full=True)  # Draw the grid first
         self.info_panel.draw(self.visited_count, self.path_length)  # Draw the info panel
         pygame.display.update()
 
     def dijkstra(self):
-        open_set = PriorityQueue()
-        self.grid.start.distance = 0
-        open_set.put(self.grid.start)
-        visited_count = 0
-
-        while not open_set.empty():
-            current = open_set.get()
-
-            if current == self.grid.end:
-                self.path_length = self.reconstruct_path(current)
-                return visited_count
-
-            current.state = PROCESSING
-            visited_count += 1
-            self.grid.draw()
-            pygame.display.update()
-            clock.tick(60)
-
-            for neighbor in self.grid.get_neighbors(current):
-                temp_distance = current.distance + 1
-                if temp_distance < neighbor.distance:
-                    neighbor.distance = temp_distance
-                    neighbor.prev = current
-                    open_set.put(neighbor)
-
-        return 0  # Return 0 if no path found
+        grid = self.grid
+        return _dijkstra_core(grid.state.ravel(), grid.distance.ravel(), grid.prev.ravel(),
+                              grid.start, grid.end)
 
     def a_star(self):
-        open_set = PriorityQueue()
-        self.grid.start.distance = 0
-        open_set.put(self.grid.start)
-        visited_count = 0
-
-        while not open_set.empty():
-            current = open_set.get()
-
-            if current == self.grid.end:
-                self.path_length = self.reconstruct_path(current)
-                return visited_count
-
-            current.state = PROCESSING
-            visited_count += 1
-            self.grid.draw()
-            pygame.display.update()
-            clock.tick(60)
-
-            for neighbor in self.grid.get_neighbors(current):
-                temp_distance = current.distance + 1
-                if temp_distance < neighbor.distance:
-                    neighbor.distance = temp_distance
-                    neighbor.prev = current
-                    neighbor.heuristic = self.heuristic(neighbor, self.grid.end)
-                    open_set.put(neighbor)
-
-        return 0  # Return 0 if no path found
-
-    def heuristic(self, node_a, node_b):
-        # Using Manhattan distance as heuristic
-        return abs(node_a.row - node_b.row) + abs(node_a.col - node_b.col)
+        grid = self.grid
+        grid.heuristic[:] = self.heuristic()  # Precomputed for every cell, so the core only does lookups
+        return _a_star_core(grid.state.ravel(), grid.distance.ravel(), grid.heuristic.ravel(),
+                            grid.prev.ravel(), grid.start, grid.end)
+
+    def heuristic(self):
+        # The field only depends on the end cell and the mode, so reruns reuse it
+        key = (self.grid.end, HEURISTIC_MODE)
+        if key not in self._heuristic_cache:
+            end_row, end_col = divmod(self.grid.end, COLS)
+            dr = np.abs(np.arange(ROWS)[:, None] - end_row)
+            dc = np.abs(np.arange(COLS)[None, :] - end_col)
+            self._heuristic_cache[key] = HEURISTICS[HEURISTIC_MODE](dr, dc)
+        return self._heuristic_cache[key]
 
     def bfs(self):
-        queue = Queue()
-        queue.put(self.grid.start)
-        visited_count = 0
-        visited = set()
-        visited.add(self.grid.start)
-
-        while not queue.empty():
-            current = queue.get()
-
-            if current == self.grid.end:
-                self.path_length = self.reconstruct_path(current)
-                return visited_count
-
-            current.state = PROCESSING
-            visited_count += 1
-            self.grid.draw()
-            pygame.display.update()
-            clock.tick(60)
-
-            for neighbor in self.grid.get_neighbors(current):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    neighbor.prev = current
-                    queue.put(neighbor)
-
-        return 0  # Return 0 if no path found
+        grid = self.grid
+        return _bfs_core(grid.state.ravel(), grid.prev.ravel(), grid.start, grid.end)
 
     def dfs(self):
-        stack = [self.grid.start]
-        visited_count = 0
-        visited = set()
-
-        while stack:
-            current = stack.pop()
-
-            if current == self.grid.end:
-                self.path_length = self.reconstruct_path(current)
-                return visited_count
+        grid = self.grid
+        return _dfs_core(grid.state.ravel(), grid.prev.ravel(), grid.start, grid.end)
+
+    def bidirectional_dijkstra(self):
+        grid = self.grid
+        return _bidirectional_dijkstra_core(grid.state.ravel(), grid.distance.ravel(), grid.prev.ravel(),
+                                            grid.start, grid.end)
+
+    def _animate(self, cells, state, batch):
+        for i in range(0, len(cells), batch):
+            self.grid.set_state(cells[i:i + batch], state)
+            pygame.display.update(self.grid.draw())
+            clock.tick(60)
 
-            if current not in visited:
-                visited.add(current)
-                current.state = PROCESSING
-                visited_count += 1
-                self.grid.draw()
-                pygame.display.update()
-                clock.tick(60)
-
-                for neighbor in self.grid.get_neighbors(current):
-                    if neighbor not in visited:
-                        neighbor.prev = current
-                        stack.append(neighbor)
-
-        return 0  # Return 0 if no path found
-
-    def reconstruct_path(self, node):
-        path_length = 0
-        while node:
-            if node.state not in (START, END):
-                node.state = PATH
-                path_length += 1
-            node = node.prev
-            self.grid.draw()
-            pygame.display.update()
-            clock.tick(20)
-        return path_length
+    def reconstruct_path(self, idx):
+        # Cells from the start to idx
+        return _extract_path(self.grid.prev.ravel(), idx)
 
 class InfoPanel:
     def __init__(self, screen, width, height):
@@ -317,27 +561,31 @@ class InfoPanel:
         self.width = width
         self.height = height
         self.font = pygame.font.SysFont("Arial", 20)
-
-    def draw(self, visited_count, path_length):
-        pygame.draw.rect(self.screen, GRAY, (self.width - 200, 0, 200, self.height))
-        controls_text = [
+        self.controls_text = [
             "Controls:",
             "Left Click: Place Start/End/Walls",
             "D: Run Dijkstra's Algorithm",
             "A: Run A* Algorithm",
             "B: Run BFS",
             "F: Run DFS",
+            "2: Run Bidirectional Dijkstra",
             "C: Clear Grid",
             "R: Reset Build"
         ]
 
-        for i, line in enumerate(controls_text):
-            text_surface = self.font.render(line, True, BLACK)
-            self.screen.blit(text_surface, (self.width - 190, 20 + i * 30))
+        # Only the result line changes between frames, so render the controls once
+        self._control_blits = [(self.font.render(line, True, BLACK).convert_alpha(), (self.width - 190, 20 + i * 30))
+                               for i, line in enumerate(self.controls_text)]
+        self._result = None  # (visited_count, path_length, rendered surface)
+
+    def draw(self, visited_count, path_length):
+        if self._result is None or self._result[:2] != (visited_count, path_length):
+            result_text = f"Visited: {visited_count}, Path Length: {path_length}"
+            self._result = (visited_count, path_length, self.font.render(result_text, True, BLACK))
 
-        result_text = f"Visited: {visited_count}, Path Length: {path_length}"
-        result_surface = self.font.render(result_text, True, BLACK)
-        self.screen.blit(result_surface, (self.width - 190, 20 + len(controls_text) * 30))
+        self.screen.fill(GRAY, (self.width - 200, 0, 200, self.height))
+        result_blit = (self._result[2], (self.width - 190, 20 + len(self.controls_text) * 30))
+        self.screen.blits(self._control_blits + [result_blit], doreturn=False)
 
 if __name__ == "__main__":
     visualizer = PathfindingVisualizer()